@@ -72,6 +72,8 @@ def main(campaign_name: str, path: str, logger: Any):
         df_employees,
     ) = foos.initialize_output_dfs()
 
+    employee_rules = foos.compile_flag_rules(foos.EMPLOYEE_STATUS_RULES)
+
     df_dict = foos.create_dict_with_all_df(path)
     df_summary = foos.create_df_summary(df_dict)
 
@@ -105,7 +107,9 @@ def main(campaign_name: str, path: str, logger: Any):
             df_invalid_matrices,
             members_with_invalid_matrices,
         ) = foos.append_to_df_invalid_matrices(df_matrix, name, df_invalid_matrices)
-        df_employees = foos.append_to_df_employees(df, name, df_employees)
+        df_employees = foos.append_to_df_employees(
+            df, name, df_employees, employee_rules
+        )
 
         df = foos.delete_problematic_entries(
             df,
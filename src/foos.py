@@ -2,7 +2,7 @@ import datetime as dt
 import glob
 import os
 import re
-from typing import Any, Dict, Set, Tuple
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
 from zipfile import ZipFile
 
 import numpy as np
@@ -11,6 +11,18 @@ import pandas as pd
 campaign_name = "INM_TEST"
 path = r"tests/data/"
 
+# Rules for flagging members by the values of a column. Each rule is a dict
+# with the `column` to check, the `kind` of test ("suffix", "prefix", "regex"
+# or "isin") and the `value` to test against (a list of values for "isin").
+# All rules are combined with OR, also across different columns: a row is
+# flagged as soon as any one rule matches.
+EMPLOYEE_STATUS_RULES = [
+    {"column": "MemberStatus", "kind": "suffix", "value": "Employee"},
+]
+
+# Compiled rules: column name -> list of predicates on a single cell value
+CompiledRules = Dict[str, List[Callable[[Any], bool]]]
+
 
 def create_output_folder(campaign_name: str, path: str) -> str:
     """Create a new folder for the resulting xlsx-files, using the same
@@ -326,15 +338,78 @@ def _get_members_with_invalid_matrices(df_matrix: pd.DataFrame) -> Set:
     return set(members_with_invalid_data)
 
 
+def compile_flag_rules(rules: List[Dict[str, Any]]) -> CompiledRules:
+    """Return a dictionary with column names as keys and a list of
+    predicate functions as values, compiled from a list of rule dicts
+    (see `EMPLOYEE_STATUS_RULES` for the format). Regex patterns are
+    compiled once here, so the rules can be reused for all segments.
+    The string rules ("suffix", "prefix", "regex") never match non-string
+    values, "isin" compares the raw values.
+    """
+    compiled_rules = {}
+    for rule in rules:
+        missing_keys = {"column", "kind", "value"} - set(rule)
+        if missing_keys:
+            raise ValueError(
+                f"Rule {rule} is missing the key(s) {sorted(missing_keys)}."
+            )
+        column, kind, value = rule["column"], rule["kind"], rule["value"]
+        if kind == "suffix":
+            predicate = lambda x, v=value: (  # noqa E731
+                isinstance(x, str) and x.endswith(v)
+            )
+        elif kind == "prefix":
+            predicate = lambda x, v=value: (  # noqa E731
+                isinstance(x, str) and x.startswith(v)
+            )
+        elif kind == "regex":
+            predicate = lambda x, p=re.compile(value): (  # noqa E731
+                isinstance(x, str) and p.search(x) is not None
+            )
+        elif kind == "isin":
+            if not isinstance(value, (list, tuple)):
+                raise ValueError(
+                    f"Value for 'isin' rule on column {column} must be a list or tuple."
+                )
+            predicate = frozenset(value).__contains__
+        else:
+            raise ValueError(f"Unknown rule kind '{kind}' for column {column}.")
+        compiled_rules.setdefault(column, []).append(predicate)
+    return compiled_rules
+
+
+def flag_rows_by_rules(df: pd.DataFrame, compiled_rules: CompiledRules) -> pd.Series:
+    """Return a boolean Series that is True for all rows matching at least
+    one of the compiled rules. Each column is factorized, so every distinct
+    value is tested only once and the result is broadcast back to the rows.
+    Missing values never match.
+    """
+    flags = np.zeros(len(df), dtype=bool)
+    for column, predicates in compiled_rules.items():
+        codes, uniques = pd.factorize(df[column])
+        hits = np.array(
+            [any(p(u) for p in predicates) for u in uniques] + [False],
+            dtype=bool,
+        )
+        flags |= hits[codes]  # code -1 (missing) maps to the trailing False
+    return pd.Series(flags, index=df.index)
+
+
 def append_to_df_employees(
-    df: pd.DataFrame, name: str, df_employees: pd.DataFrame
+    df: pd.DataFrame,
+    name: str,
+    df_employees: pd.DataFrame,
+    compiled_rules: Optional[CompiledRules] = None,
 ) -> pd.DataFrame:
     """Append members with employee status to the respective output df.
-    (These members will NOT be deleted later on.)
+    The status is checked with `compiled_rules` (defaults to the compiled
+    `EMPLOYEE_STATUS_RULES`). (These members will NOT be deleted later on.)
     """
-    employees = df.loc[
-        df["MemberStatus"].str.endswith("Employee") == True  # noqa E712
-    ][["memberid", "MemberName", "MemberStatus"]]
+    if compiled_rules is None:
+        compiled_rules = compile_flag_rules(EMPLOYEE_STATUS_RULES)
+    employees = df.loc[flag_rows_by_rules(df, compiled_rules)][
+        ["memberid", "MemberName", "MemberStatus"]
+    ]
     employees["source"] = name
     employees["action"] = "not_deleted"
     df_employees = pd.concat([df_employees, employees], ignore_index=True)
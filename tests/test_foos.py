@@ -1,8 +1,8 @@
 import os
 
 import numpy as np
-
-# import pandas as pd
+import pandas as pd
+import pytest
 
 from src import foos  # noqa
 
@@ -74,3 +74,59 @@ def test_create_temp_df_for_address_handling(df_pytest):
 def test_append_to_df_city_no_zip(df_pytest):
     df = foos.append_to_df_city_no_zip(df_pytest)
     assert df["memberid"].values == np.array([683415])
+
+
+def test_flag_rows_by_rules():
+    df = pd.DataFrame(
+        {
+            "MemberStatus": ["Employee", "Gold", None, "Ex-Employee", "Gold"],
+            "MemberName": ["A", "B", "C", "D", "Test User"],
+        }
+    )
+    compiled_rules = foos.compile_flag_rules(
+        [
+            {"column": "MemberStatus", "kind": "suffix", "value": "Employee"},
+            {"column": "MemberStatus", "kind": "isin", "value": ["Platinum"]},
+            {"column": "MemberName", "kind": "regex", "value": r"^Test"},
+        ]
+    )
+    flags = foos.flag_rows_by_rules(df, compiled_rules)
+    assert flags.tolist() == [True, False, False, True, True]
+
+
+def test_flag_rows_by_rules_prefix_and_raw_isin():
+    df = pd.DataFrame(
+        {
+            "MemberStatus": ["Employee Gold", "Gold", "Ex-Employee", None],
+            "Segment": [1, 2, 3, 13],
+        }
+    )
+    compiled_rules = foos.compile_flag_rules(
+        [
+            {"column": "MemberStatus", "kind": "prefix", "value": "Employee"},
+            {"column": "Segment", "kind": "isin", "value": [2]},
+            {"column": "Segment", "kind": "suffix", "value": "3"},
+        ]
+    )
+    flags = foos.flag_rows_by_rules(df, compiled_rules)
+    assert flags.tolist() == [True, True, False, False]
+
+
+def test_compile_flag_rules_invalid_rules():
+    with pytest.raises(ValueError):
+        foos.compile_flag_rules(
+            [{"column": "MemberStatus", "kind": "contains", "value": "Employee"}]
+        )
+    with pytest.raises(ValueError):
+        foos.compile_flag_rules(
+            [{"column": "MemberStatus", "kind": "isin", "value": "Gold"}]
+        )
+    with pytest.raises(ValueError):
+        foos.compile_flag_rules([{"column": "MemberStatus", "kind": "suffix"}])
+
+
+def test_append_to_df_employees(df_pytest):
+    df_employees = foos.initialize_output_dfs()[-1]
+    df = foos.append_to_df_employees(df_pytest, "df_pytest.csv", df_employees)
+    assert df["memberid"].tolist() == df_pytest.loc[[0, 1], "memberid"].tolist()
+    assert (df["action"] == "not_deleted").all()